@@ -0,0 +1,95 @@
+"""
+Startup and point-lookup timing for lookup.LocationIndex on a synthetic
+movies_locations_long.parquet shaped like a full run (left-merged titles,
+~25% of rows without a location), after checking that an output with no fetched
+locations loads. Exits non-zero if startup misses the target.
+
+    python bench_lookup.py [n_rows]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from lookup import LocationIndex
+
+STARTUP_TARGET_S = 1.0
+
+def make_long_table(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    n_titles = max(1, n_rows // 5)
+    n_labels = max(1, n_rows // 8)
+    tconsts = np.array([f"tt{i:07d}" for i in range(n_titles)], dtype=object)
+    labels = np.array([f"Place {i}, Region {i % 97}, Country" for i in range(n_labels)], dtype=object)
+
+    label_idx = (rng.zipf(1.5, n_rows) - 1) % n_labels
+    location_label = labels[label_idx]
+    location_label[rng.random(n_rows) < 0.25] = None
+    return pd.DataFrame({
+        "tconst": tconsts[np.sort(rng.integers(0, n_titles, n_rows))],
+        "primaryTitle": "Some Title",
+        "location_kind": "filming",
+        "location_label": location_label,
+        "lat": None,
+        "lon": None,
+        "location_class": "unknown",
+        "is_fictional": False,
+    })
+
+def check_no_locations(tmp: str) -> None:
+    """
+    A run where nothing was fetched: left-merging an empty loc_long leaves every
+    location column all-null, which parquet stores as Arrow null type.
+    """
+    movies = pd.DataFrame({"tconst": ["tt0000001", "tt0000002"], "primaryTitle": ["A", "B"]})
+    loc_long = pd.DataFrame(columns=[
+        "tconst", "location_kind", "location_item", "location_label", "lat", "lon",
+        "location_class", "is_fictional",
+    ])
+    path = os.path.join(tmp, "empty_long.parquet")
+    movies.merge(loc_long, on="tconst", how="left").to_parquet(path, index=False)
+
+    index = LocationIndex(path)
+    assert len(index) == 0
+    assert index.locations_for("tt0000001") == []
+    assert index.titles_at("anywhere") == []
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_500_000
+    with tempfile.TemporaryDirectory() as tmp:
+        check_no_locations(tmp)
+
+        path = os.path.join(tmp, "movies_locations_long.parquet")
+        df = make_long_table(n_rows)
+        df.to_parquet(path, index=False)
+
+        t0 = time.perf_counter()
+        index = LocationIndex(path)
+        startup = time.perf_counter() - t0
+
+        probe_t = df["tconst"].sample(10_000, replace=True, random_state=1).tolist()
+        # distinct labels, so a few hub locations with huge result lists don't dominate
+        probe_l = df["location_label"].dropna().drop_duplicates().sample(10_000, replace=True, random_state=1).tolist()
+
+        t0 = time.perf_counter()
+        for t in probe_t:
+            index.locations_for(t)
+        per_title = (time.perf_counter() - t0) / len(probe_t)
+
+        t0 = time.perf_counter()
+        for label in probe_l:
+            index.titles_at(label)
+        per_label = (time.perf_counter() - t0) / len(probe_l)
+
+    print(f"rows: {n_rows:,}  titles: {len(index):,}")
+    print(f"startup: {startup:.3f} s (target < {STARTUP_TARGET_S:.1f} s)")
+    print(f"locations_for: {per_title * 1e6:.1f} us/lookup")
+    print(f"titles_at: {per_label * 1e6:.1f} us/lookup")
+    if startup >= STARTUP_TARGET_S:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from location_classify import normalize_label
+
+NEIGHBOR_COLUMNS = [
+    "tconst", "neighbor_tconst", "rank", "shared_locations", "jaccard", "idf_score",
+]
+_RANK_BY = ("shared_locations", "jaccard", "idf_score")
+
+def build_incidence(loc_long: pd.DataFrame):
+    """
+    Binary title x location matrix from long-form locations.
+    Returns (X as csr, array mapping row codes -> tconst, array mapping column codes -> label).
+    Labels are keyed by location_classify.normalize_label, applied once per distinct raw label.
+    """
+    df = loc_long[["tconst", "location_label"]].dropna()
+    raw_codes, raw_labels = pd.factorize(df["location_label"].astype(str))
+    normalized = np.array([normalize_label(x) for x in raw_labels], dtype=object)
+    df = pd.DataFrame({"tconst": df["tconst"].values, "label": normalized[raw_codes]})
+    df = df[df["label"] != ""].drop_duplicates()
+
+    t_codes, tconsts = pd.factorize(df["tconst"])
+    l_codes, label_values = pd.factorize(df["label"])
+    X = sparse.csr_matrix(
+        (np.ones(len(df), dtype=np.float32), (t_codes, l_codes)),
+        shape=(len(tconsts), len(label_values)),
+    )
+    return X, np.asarray(tconsts), np.asarray(label_values)
+
+def _row_blocks(costs: np.ndarray, block_size: int, max_block_nnz: int):
+    """
+    Split rows into consecutive [start, stop) blocks of at most `block_size` rows whose
+    summed cost (an upper bound on the block product's nnz) stays within `max_block_nnz`.
+    A single row over budget still gets its own block.
+    """
+    cum = np.cumsum(costs)
+    n = len(costs)
+    start = 0
+    while start < n:
+        base = cum[start - 1] if start else 0.0
+        stop = int(np.searchsorted(cum, base + max_block_nnz, side="right"))
+        stop = min(max(stop, start + 1), start + block_size, n)
+        yield start, stop
+        start = stop
+
+def compute_colocation_neighbors(
+    loc_long: pd.DataFrame,
+    top_k: int = 20,
+    block_size: int = 2048,
+    rank_by: str = "idf_score",
+    min_shared: int = 1,
+    max_label_titles: Optional[int] = 1000,
+    max_block_nnz: int = 5_000_000,
+) -> pd.DataFrame:
+    """
+    Title-to-title similarity from shared filming locations:
+      - shared_locations: number of locations in common
+      - jaccard: shared / |union|
+      - idf_score: sum of log(1 + n_titles / titles_at_location) over shared locations
+    Similarities come from sparse products of row blocks against the whole matrix.
+    Blocks hold at most `block_size` titles and at most `max_block_nnz` candidate pairs
+    (estimated from location frequencies), so memory is bounded by `max_block_nnz`
+    except for a single title whose own pairs exceed it; locations held by more than
+    `max_label_titles` titles are dropped, which caps that per-title worst case.
+    Only the `top_k` neighbors per title (ordered by `rank_by`) are kept.
+    """
+    if rank_by not in _RANK_BY:
+        raise ValueError(f"rank_by must be one of {_RANK_BY}, got {rank_by!r}")
+    if block_size < 1:
+        raise ValueError(f"block_size must be >= 1, got {block_size!r}")
+    if loc_long.empty:
+        return pd.DataFrame(columns=NEIGHBOR_COLUMNS)
+
+    X, tconsts, _ = build_incidence(loc_long)
+    n_titles = X.shape[0]
+    # sizes count every location, including unshared ones (Jaccard denominator)
+    sizes = np.asarray(X.sum(axis=1)).ravel()
+    doc_freq = np.asarray(X.sum(axis=0)).ravel()
+
+    # locations held by a single title can never be shared; hub locations
+    # (e.g. a whole country) can be capped with max_label_titles
+    keep = doc_freq >= 2
+    if max_label_titles is not None:
+        keep &= doc_freq <= max_label_titles
+
+    X = X[:, np.flatnonzero(keep)].tocsr()
+    kept_freq = doc_freq[keep]
+    idf = np.log1p(n_titles / kept_freq).astype(np.float32)
+    XT = X.T.tocsr()
+    # one product yields both scores: real part counts shared locations,
+    # imaginary part sums their idf
+    X_c = X.multiply((1 + 1j * idf)[np.newaxis, :]).astype(np.complex64).tocsr()
+    costs = X @ kept_freq.astype(np.float64)
+
+    frames = []
+    for start, stop in _row_blocks(costs, block_size, max_block_nnz):
+        prod = (X_c[start:stop] @ XT).tocsr()
+
+        rows = np.repeat(np.arange(start, stop, dtype=np.int32), np.diff(prod.indptr))
+        cols = prod.indices.astype(np.int32, copy=False)
+        n_shared = np.rint(prod.data.real).astype(np.int32)
+        idf_score = prod.data.imag
+        del prod
+
+        mask = (cols != rows) & (n_shared >= min_shared)
+        rows, cols, n_shared, idf_score = rows[mask], cols[mask], n_shared[mask], idf_score[mask]
+        if not len(rows):
+            continue
+        jaccard = n_shared / (sizes[rows] + sizes[cols] - n_shared)
+
+        score = {"shared_locations": n_shared, "jaccard": jaccard, "idf_score": idf_score}[rank_by]
+        # per row: best score first, ties broken by neighbor code for determinism
+        order = np.lexsort((cols, -score, rows))
+        rows, cols = rows[order], cols[order]
+        n_shared, jaccard, idf_score = n_shared[order], jaccard[order], idf_score[order]
+
+        first = np.r_[0, np.flatnonzero(np.diff(rows)) + 1]
+        group_start = np.repeat(first, np.diff(np.r_[first, len(rows)]))
+        rank = np.arange(len(rows)) - group_start + 1
+        top = rank <= top_k
+
+        frames.append(pd.DataFrame({
+            "tconst": tconsts[rows[top]],
+            "neighbor_tconst": tconsts[cols[top]],
+            "rank": rank[top],
+            "shared_locations": n_shared[top],
+            "jaccard": jaccard[top].astype(np.float32),
+            "idf_score": idf_score[top],
+        }))
+
+    if not frames:
+        return pd.DataFrame(columns=NEIGHBOR_COLUMNS)
+    return pd.concat(frames, ignore_index=True)[NEIGHBOR_COLUMNS]
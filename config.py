@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 import os
+from typing import Optional, Tuple
 
 @dataclass(frozen=True)
 class Config:
@@ -15,6 +16,23 @@ class Config:
     rapidapi_sleep_s: float = 0.3
     rapidapi_cache_dir: str = "data_out/rapidapi_location_cache"
 
+    # Fetch scheduling: most popular titles first, optional allow-list and cut-offs
+    fetch_priority_col: Optional[str] = "numVotes"   # None keeps dataset order
+    fetch_allow_list: Optional[Tuple[str, ...]] = None
+    fetch_max_requests: Optional[int] = None      # network fetches per run; cached titles are free
+    fetch_time_budget_s: Optional[float] = None   # applies to network fetches only
+
+    # Local lookup endpoint (lookup.py)
+    lookup_host: str = "127.0.0.1"
+    lookup_port: int = 8765
+
+    # Co-location neighbors (colocation.py)
+    enable_colocation: bool = True
+    colocation_top_k: int = 20
+    colocation_block_size: int = 2048
+    colocation_max_label_titles: Optional[int] = 1000   # drop hub locations shared by more titles
+    colocation_max_block_nnz: int = 5_000_000           # candidate pairs per block (memory bound)
+
     # Geocoding (optional)
     enable_geocoding: bool = False
     geocode_sleep_s: float = 1.0
@@ -167,6 +167,8 @@ def imdb_filming_locations_via_rapidapi(
     sleep_s: float = 0.2,
     cache_dir: Optional[str] = None,
     user_agent: str = "imdb-locations/1.0 (contact: you@example.com)",
+    time_budget_s: Optional[float] = None,
+    max_requests: Optional[int] = None,
 ) -> pd.DataFrame:
     """
     Fetch filming locations for IMDb titles using RapidAPI 'imdb-com' endpoint.
@@ -177,6 +179,10 @@ def imdb_filming_locations_via_rapidapi(
     Notes:
     - This fetches FILMING locations only.
     - Most providers return location strings, not coordinates, so lat/lon stay None.
+    - Titles are fetched in the given order (pre-order with scheduler.prioritize_tconsts).
+      `time_budget_s` and `max_requests` only limit network fetches: once either is
+      spent, uncached titles are skipped (overrun is at most one request incl. retries)
+      while cached payloads are still read, so repeated runs keep extending coverage.
     """
     tlist = [t for t in tconsts if isinstance(t, str) and t.startswith("tt")]
     cache_path = Path(cache_dir) if cache_dir else None
@@ -198,12 +204,19 @@ def imdb_filming_locations_via_rapidapi(
         base_url = f"https://{rapidapi_host}".rstrip("/")
 
     rows: List[Dict[str, Any]] = []
+    started = time.monotonic()
+    n_requests = 0
 
     for batch in _chunks(tlist, batch_size):
         for tconst in batch:
             cached = _load_cached_json(cache_path, tconst)
             payload = cached
             if payload is None:
+                if max_requests is not None and n_requests >= max_requests:
+                    continue
+                if time_budget_s is not None and time.monotonic() - started >= time_budget_s:
+                    continue
+                n_requests += 1
                 url = f"{base_url}/title/get-filming-locations"
                 resp = session.get(url, params={"tconst": tconst}, headers=headers)
 
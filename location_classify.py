@@ -6,6 +6,13 @@ _FICTIONAL_HINTS = [
     "atlantis", "pandora", "springfield (fictional)", "tatooine",
 ]
 _HINT_RE = re.compile("|".join(re.escape(x) for x in _FICTIONAL_HINTS), re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+
+def normalize_label(label: str) -> str:
+    """
+    Key for matching location labels: collapsed whitespace, stripped, lowercased.
+    """
+    return _WS_RE.sub(" ", label).strip().lower()
 
 def classify_location(label: Optional[str], lat: Optional[float], lon: Optional[float]) -> Tuple[str, bool]:
     """
@@ -0,0 +1,149 @@
+import json
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, unquote, urlparse
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from config import Config
+from location_classify import normalize_label
+
+LOOKUP_COLUMNS = [
+    "tconst", "location_kind", "location_label", "lat", "lon",
+    "location_class", "is_fictional",
+]
+
+class LocationIndex:
+    """
+    Lookup over movies_locations_long.parquet.
+      - tconst -> location rows
+      - normalized location label -> tconsts
+    The parquet file is memory-mapped and only the lookup columns are read. Rows
+    without a label are dropped in Arrow and both indexes are offset arrays over
+    integer codes, so row dicts are only built per lookup. Results are fresh lists.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        table = pq.read_table(path, memory_map=True, columns=self._columns(path))
+
+        # a run without any fetched locations writes the label column as Arrow null type
+        for name in ("tconst", "location_label"):
+            i = table.schema.get_field_index(name)
+            table = table.set_column(i, name, table.column(name).cast(pa.string()))
+
+        valid = pc.and_(
+            pc.is_valid(table.column("tconst")),
+            pc.not_equal(pc.utf8_trim_whitespace(table.column("location_label")), ""),
+        )
+        table = table.filter(pc.fill_null(valid, False))
+
+        # tconst -> contiguous row range; pipeline output is already grouped by title,
+        # otherwise a stable sort keeps file order within a title
+        t_enc = pc.dictionary_encode(table.column("tconst").combine_chunks())
+        t_codes = t_enc.indices.to_numpy(zero_copy_only=False)
+        self._tconsts = t_enc.dictionary.to_numpy(zero_copy_only=False)
+        self._tconst_code = {t: i for i, t in enumerate(self._tconsts.tolist())}
+        if len(t_codes) and (np.diff(t_codes) < 0).any():
+            order = np.argsort(t_codes, kind="stable")
+            table = table.take(pa.array(order))
+            t_codes = t_codes[order]
+        self._table = table
+        self._row_offsets = np.r_[0, np.cumsum(np.bincount(t_codes, minlength=len(self._tconsts)))]
+
+        # normalized label -> tconst codes; normalize_label runs once per distinct raw label
+        l_enc = pc.dictionary_encode(table.column("location_label").combine_chunks())
+        raw_codes = l_enc.indices.to_numpy(zero_copy_only=False)
+        normalized = [normalize_label(x) for x in l_enc.dictionary.to_pylist()]
+        norm_values, norm_of_raw = np.unique(np.array(normalized, dtype=object), return_inverse=True)
+        self._label_code = {v: i for i, v in enumerate(norm_values.tolist())}
+
+        # sort (label, title) pair keys and drop repeats of a label within a title
+        n_titles = max(len(self._tconsts), 1)
+        pairs = np.sort(norm_of_raw[raw_codes].astype(np.int64) * n_titles + t_codes)
+        pairs = pairs[np.r_[True, pairs[1:] != pairs[:-1]]] if len(pairs) else pairs
+        self._label_titles = pairs % n_titles
+        self._label_offsets = np.r_[0, np.cumsum(np.bincount(pairs // n_titles, minlength=len(norm_values)))]
+
+    @staticmethod
+    def _columns(path: str) -> List[str]:
+        available = set(pq.read_schema(path).names)
+        missing = {"tconst", "location_label"} - available
+        if missing:
+            raise ValueError(f"{path} is missing required columns: {sorted(missing)}")
+        return [c for c in LOOKUP_COLUMNS if c in available]
+
+    def __len__(self) -> int:
+        return len(self._tconsts)
+
+    def locations_for(self, tconst: str) -> List[Dict[str, Any]]:
+        code = self._tconst_code.get(tconst)
+        if code is None:
+            return []
+        start, stop = self._row_offsets[code], self._row_offsets[code + 1]
+        return self._table.slice(start, stop - start).to_pylist()
+
+    def titles_at(self, label: str) -> List[str]:
+        code = self._label_code.get(normalize_label(label))
+        if code is None:
+            return []
+        start, stop = self._label_offsets[code], self._label_offsets[code + 1]
+        return self._tconsts[self._label_titles[start:stop]].tolist()
+
+def default_long_path(cfg: Config) -> str:
+    return os.path.join(cfg.out_dir, "movies_locations_long.parquet")
+
+def _make_handler(index: LocationIndex) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            body: Optional[Any] = None
+            if url.path.startswith("/title/"):
+                tconst = unquote(url.path[len("/title/"):])
+                body = {"tconst": tconst, "locations": index.locations_for(tconst)}
+            elif url.path == "/location":
+                q = parse_qs(url.query).get("q", [""])[0]
+                body = {"location": q, "tconsts": index.titles_at(q)}
+
+            if body is None:
+                self.send_error(404, "Use /title/<tconst> or /location?q=<label>")
+                return
+            data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            # keep request logging out of the hot path
+            pass
+
+    return Handler
+
+def serve(index: LocationIndex, host: str = "127.0.0.1", port: int = 8765) -> None:
+    """
+    Small local JSON endpoint:
+      GET /title/<tconst>          -> location rows for the title
+      GET /location?q=<label>      -> tconsts filmed at the label
+    """
+    server = ThreadingHTTPServer((host, port), _make_handler(index))
+    print(f"Serving {len(index):,} titles on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+def main():
+    cfg = Config()
+    index = LocationIndex(default_long_path(cfg))
+    serve(index, host=cfg.lookup_host, port=cfg.lookup_port)
+
+if __name__ == "__main__":
+    main()
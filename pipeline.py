@@ -6,9 +6,11 @@ from config import Config
 import storage
 from imdb_datasets import load_movies_with_ratings
 from filmlocations import imdb_filming_locations_via_rapidapi
+from scheduler import prioritize_tconsts
 from location_classify import classify_location
 from geocode import geocode_nominatim
 from features import compute_title_level_features
+from colocation import compute_colocation_neighbors
 
 def build_location_long_table(cfg: Config, movies_df: pd.DataFrame) -> pd.DataFrame:
     rapidapi_key = cfg.get_rapidapi_key()
@@ -17,7 +19,11 @@ def build_location_long_table(cfg: Config, movies_df: pd.DataFrame) -> pd.DataFr
             f"RapidAPI key missing. Set env var {cfg.rapidapi_key_env_var} before running."
         )
 
-    tconsts = movies_df["tconst"].dropna().unique().tolist()
+    tconsts = prioritize_tconsts(
+        movies_df,
+        priority_col=cfg.fetch_priority_col,
+        allow_list=cfg.fetch_allow_list,
+    )
 
     # 1) Fetch filming locations via RapidAPI (on-disk cache optional)
     loc_long = imdb_filming_locations_via_rapidapi(
@@ -28,6 +34,8 @@ def build_location_long_table(cfg: Config, movies_df: pd.DataFrame) -> pd.DataFr
         sleep_s=cfg.rapidapi_sleep_s,
         cache_dir=cfg.rapidapi_cache_dir,
         user_agent=cfg.user_agent,
+        time_budget_s=cfg.fetch_time_budget_s,
+        max_requests=cfg.fetch_max_requests,
     )
 
     if loc_long.empty:
@@ -100,12 +108,27 @@ def main():
     title_feats = compute_title_level_features(loc_long) if len(loc_long) else pd.DataFrame({"tconst": movies_df["tconst"]})
     merged_wide = movies_df.merge(title_feats, on="tconst", how="left")
 
+    # Title-to-title co-location neighbors (optional)
+    neighbors = None
+    if cfg.enable_colocation and len(loc_long):
+        neighbors = compute_colocation_neighbors(
+            loc_long,
+            top_k=cfg.colocation_top_k,
+            block_size=cfg.colocation_block_size,
+            max_label_titles=cfg.colocation_max_label_titles,
+            max_block_nnz=cfg.colocation_max_block_nnz,
+        )
+        print(f"Neighbor rows: {len(neighbors):,}")
+
     # Output
     long_path = os.path.join(cfg.out_dir, "movies_locations_long.parquet")
     wide_path = os.path.join(cfg.out_dir, "movies_locations_title_features.parquet")
 
     merged_long.to_parquet(long_path, index=False)
     merged_wide.to_parquet(wide_path, index=False)
+    if neighbors is not None:
+        neighbors_path = os.path.join(cfg.out_dir, "movies_locations_neighbors.parquet")
+        neighbors.to_parquet(neighbors_path, index=False)
 
     # Also small CSV samples for inspection
     merged_long.head(5000).to_csv(os.path.join(cfg.out_dir, "sample_long.csv"), index=False)
@@ -114,6 +137,8 @@ def main():
     print("Wrote:")
     print(" -", long_path)
     print(" -", wide_path)
+    if neighbors is not None:
+        print(" -", neighbors_path)
 
 if __name__ == "__main__":
     main()
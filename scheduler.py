@@ -0,0 +1,30 @@
+from typing import Iterable, List, Optional
+
+import pandas as pd
+
+def prioritize_tconsts(
+    movies_df: pd.DataFrame,
+    priority_col: Optional[str] = "numVotes",
+    allow_list: Optional[Iterable[str]] = None,
+) -> List[str]:
+    """
+    Order titles for fetching so the most valuable ones are requested first.
+      - highest `priority_col` first (missing priority goes last), ties keep input order
+      - if `allow_list` is given, only those tconsts are kept
+    Pass priority_col=None to keep the input order.
+    """
+    df = movies_df[movies_df["tconst"].notna()]
+
+    if allow_list is not None:
+        allowed = {t for t in allow_list if isinstance(t, str)}
+        df = df[df["tconst"].isin(allowed)]
+
+    if priority_col:
+        if priority_col not in df.columns:
+            raise KeyError(f"Priority column '{priority_col}' not in movies dataframe.")
+        prio = pd.to_numeric(df[priority_col], errors="coerce")
+        df = df.assign(_priority=prio).sort_values(
+            "_priority", ascending=False, na_position="last", kind="stable"
+        )
+
+    return df["tconst"].drop_duplicates().tolist()